@@ -11,17 +11,27 @@ __all__ = [
 ]
 
 import datetime
-import hashlib
+import functools
 from datetime import timezone
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
+
+from persistence import load_last_played, load_scores
+
+# (scores_path, player, date) combinations known to be completed
+_completed_today: Set[Tuple[str, str, str]] = set()
+
+
+def _today_utc() -> datetime.date:
+    """Return today's date in UTC, the calendar the daily word follows."""
+    return datetime.datetime.now(timezone.utc).date()
 
 
 def select_daily_word(words: List[str], date: Optional[datetime.date] = None) -> str:
     """
     Select a deterministic word based on the given date.
 
-    Uses SHA-256 hash of the date string as a seed to ensure
-    all players get the same word for the same date.
+    Mixes the date's ordinal through a SplitMix64 step to get a seed,
+    ensuring all players get the same word for the same date.
 
     Args:
         words: List of available words
@@ -45,50 +55,68 @@ def select_daily_word(words: List[str], date: Optional[datetime.date] = None) ->
 
     # Use today's date if none provided
     if date is None:
-        date = datetime.datetime.now(timezone.utc).date()
-
-    # Create deterministic seed from date
-    date_string = str(date)  # Format: YYYY-MM-DD
-    hash_object = hashlib.sha256(date_string.encode())
-    hash_hex = hash_object.hexdigest()
-
-    # Convert first 8 characters of hash to integer for indexing
-    seed = int(hash_hex[:8], 16)
+        date = _today_utc()
 
     # Select word using modulo to ensure valid index
-    word_index = seed % len(words)
+    word_index = _daily_seed(date.toordinal()) % len(words)
 
     return words[word_index].upper().strip()
 
 
-def get_next_daily_reset() -> datetime.datetime:
+@functools.lru_cache(maxsize=512)
+def _daily_seed(ordinal: int) -> int:
+    """
+    Derive the deterministic seed for a date ordinal (SplitMix64 finalizer).
+
+    Args:
+        ordinal: Proleptic Gregorian ordinal of the date
+
+    Returns:
+        64-bit seed shared by every player for that date
+    """
+    seed = (ordinal + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    seed = ((seed ^ (seed >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    seed = ((seed ^ (seed >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return seed ^ (seed >> 31)
+
+
+def get_next_daily_reset(now: Optional[datetime.datetime] = None) -> datetime.datetime:
     """
     Get the next daily reset time (midnight UTC).
 
+    Args:
+        now: Current UTC time (defaults to now)
+
     Returns:
         Next midnight UTC as datetime object
     """
-    now = datetime.datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.datetime.now(timezone.utc)
     tomorrow = now.date() + datetime.timedelta(days=1)
     next_reset = datetime.datetime.combine(tomorrow, datetime.time.min, timezone.utc)
 
     return next_reset
 
 
-def time_until_next_daily() -> str:
+def time_until_next_daily(now: Optional[datetime.datetime] = None) -> str:
     """
     Get human-readable time until next daily word.
 
+    Args:
+        now: Current UTC time (defaults to now)
+
     Returns:
         Formatted string like "5h 23m" or "23m 45s"
     """
-    now = datetime.datetime.now(timezone.utc)
-    next_reset = get_next_daily_reset()
-    delta = next_reset - now
+    if now is None:
+        now = datetime.datetime.now(timezone.utc)
 
-    hours = delta.seconds // 3600
-    minutes = (delta.seconds % 3600) // 60
-    seconds = delta.seconds % 60
+    # Whole seconds left until midnight UTC, rounded down
+    elapsed = now.hour * 3600 + now.minute * 60 + now.second
+    remaining = (86400 - elapsed - (1 if now.microsecond else 0)) % 86400
+
+    hours, rest = divmod(remaining, 3600)
+    minutes, seconds = divmod(rest, 60)
 
     if hours > 0:
         return f"{hours}h {minutes}m"
@@ -98,7 +126,7 @@ def time_until_next_daily() -> str:
         return f"{seconds}s"
 
 
-def is_daily_completed(player: str, scores_path: Optional[str] = "scores.json") -> bool:
+def is_daily_completed(player: str, scores_path: Optional[str] = "scores.jsonl") -> bool:
     """
     Check if player has already completed today's daily word.
 
@@ -112,22 +140,32 @@ def is_daily_completed(player: str, scores_path: Optional[str] = "scores.json")
     if not scores_path:
         return False
 
-    try:
-        from persistence import load_scores
-        scores = load_scores(scores_path)
-
-        today = datetime.datetime.now(timezone.utc).date()
-        today_str = str(today)
+    today_str = str(_today_utc())
 
-        # Check if player has a score from today
-        for score in reversed(scores):  # Check recent scores first
-            if score.get("player") == player:
-                score_date = score.get("date", "")
-                if score_date.startswith(today_str):
-                    return True
+    # Scores are only ever appended, so once a player has completed today's
+    # word the answer can't change until the date does
+    cache_key = (str(scores_path), player, today_str)
+    if cache_key in _completed_today:
+        return True
 
-        return False
+    try:
+        # Use the sidecar index when it is up to date with the scores file
+        last_played = load_last_played(scores_path)
+        if last_played is not None:
+            completed = last_played.get(player, "").startswith(today_str)
+        else:
+            scores = load_scores(scores_path)
+
+            # Check if player has a score from today
+            completed = any(
+                score.get("player") == player and score.get("date", "").startswith(today_str)
+                for score in reversed(scores)  # Check recent scores first
+            )
 
     except Exception:
         # If we can't load scores, assume not completed
         return False
+
+    if completed:
+        _completed_today.add(cache_key)
+    return completed
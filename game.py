@@ -10,12 +10,19 @@ __all__ = ['WordGuruGame']
 import datetime
 import pathlib
 import random
+from collections import Counter
 from datetime import timezone
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-from daily import select_daily_word
+from daily import is_daily_completed, select_daily_word, time_until_next_daily
 from persistence import create_score, save_score
 
+# Bound once for games started in bulk (benchmarks, auto-players)
+_randrange = random.randrange
+
+# Feedback mark appended to each guessed letter, by letter status
+_FEEDBACK_MARKS = {"correct": "✓", "present": "~", "absent": "✗"}
+
 
 class WordGuruGame:
     """
@@ -26,22 +33,29 @@ class WordGuruGame:
     """
 
     def __init__(self, word_list: List[str], max_attempts: int = 6,
-                 scores_path: Union[str, pathlib.Path, None] = "scores.json",
-                 player: str = "anonymous", daily_mode: bool = False):
+                 scores_path: Union[str, pathlib.Path, None] = "scores.jsonl",
+                 player: str = "anonymous", daily_mode: bool = False,
+                 *, _normalized: bool = False):
         """
         Initialize the game with word dictionary.
 
         Args:
             word_list: List of valid words for the game
             max_attempts: Maximum number of guess attempts (default: 6)
-            scores_path: Path to scores JSON file, None to disable persistence
+            scores_path: Path to scores file (.json or .jsonl), None to disable persistence
             player: Player name for score tracking
             daily_mode: If True, use daily word selection
+            _normalized: Internal flag for callers whose words are already
+                uppercase and stripped (e.g. from load_words); the list is
+                then used as-is instead of being normalized again
 
         Raises:
             ValueError: If word list contains invalid words
         """
-        self.word_list = [word.upper().strip() for word in word_list]
+        if _normalized:
+            self.word_list = word_list
+        else:
+            self.word_list = [word.upper().strip() for word in word_list]
 
         # Validate word list before proceeding
         self._validate_word_list()
@@ -50,7 +64,7 @@ class WordGuruGame:
         self.scores_path = scores_path
         self.player = player
         self.daily_mode = daily_mode
-        self.current_word: Optional[str] = None
+        self.current_word = None
         self.attempts: List[str] = []
         self.game_over: bool = False
         self.won: bool = False
@@ -90,6 +104,19 @@ class WordGuruGame:
             error_msg += "\nAll words must be exactly 5 letters long and contain only letters."
             raise ValueError(error_msg)
 
+    @property
+    def current_word(self) -> Optional[str]:
+        """The target word of the current game, or None if not started."""
+        return self._current_word
+
+    @current_word.setter
+    def current_word(self, word: Optional[str]) -> None:
+        self._current_word = word
+
+        # Count the target's letters once per game; each guess scores
+        # against a copy instead of recounting them
+        self._target_counts = {} if word is None else dict(Counter(word))
+
     def start_game(self) -> None:
         """
         Start a new game session.
@@ -104,7 +131,7 @@ class WordGuruGame:
             self.current_word = select_daily_word(self.word_list)
             mode_text = "daily"
         else:
-            self.current_word = random.choice(self.word_list)
+            self.current_word = self.word_list[_randrange(len(self.word_list))]
             mode_text = "random"
 
         self.attempts = []
@@ -134,14 +161,17 @@ class WordGuruGame:
             RuntimeError: If game not started
             ValueError: If guess length doesn't match word length
         """
-        if self.current_word is None:
+        # Read the target once: current_word is a property, so every
+        # self.current_word read in the scoring loop would be a call
+        target = self.current_word
+        if target is None:
             raise RuntimeError("Game not started. Call start_game() first.")
 
         guess = guess.upper().strip()
 
         # Validate guess length
-        if len(guess) != len(self.current_word):
-            raise ValueError(f"Guess must be {len(self.current_word)} letters long")
+        if len(guess) != len(target):
+            raise ValueError(f"Guess must be {len(target)} letters long")
 
         # Validate guess contains only letters
         if not guess.isalpha():
@@ -151,39 +181,28 @@ class WordGuruGame:
         self.attempts.append(guess)
 
         # Calculate detailed letter feedback
+        remaining = self._target_counts.copy()
         letter_statuses = []
-        feedback_summary = []
-
-        # Track letter counts in target word for accurate "present" detection
-        target_letter_counts = {}
-        for letter in self.current_word:
-            target_letter_counts[letter] = target_letter_counts.get(letter, 0) + 1
 
         # First pass: mark correct positions
-        used_target_letters = {}
-        for i, letter in enumerate(guess):
-            if letter == self.current_word[i]:
+        for letter, target_letter in zip(guess, target):
+            if letter == target_letter:
                 letter_statuses.append("correct")
-                feedback_summary.append(f"{letter}✓")
-                used_target_letters[letter] = used_target_letters.get(letter, 0) + 1
+                remaining[letter] -= 1
             else:
-                letter_statuses.append("pending")  # Will be updated in second pass
-                feedback_summary.append(f"{letter}?")
+                letter_statuses.append("absent")
 
-        # Second pass: mark present/absent for non-correct letters
+        # Second pass: mark present letters while the target still has some left
         for i, letter in enumerate(guess):
-            if letter_statuses[i] == "pending":
-                available_count = target_letter_counts.get(letter, 0) - used_target_letters.get(letter, 0)
-                if available_count > 0:
-                    letter_statuses[i] = "present"
-                    feedback_summary[i] = f"{letter}~"
-                    used_target_letters[letter] = used_target_letters.get(letter, 0) + 1
-                else:
-                    letter_statuses[i] = "absent"
-                    feedback_summary[i] = f"{letter}✗"
+            if letter_statuses[i] == "absent" and remaining.get(letter, 0) > 0:
+                letter_statuses[i] = "present"
+                remaining[letter] -= 1
+
+        feedback_summary = [letter + _FEEDBACK_MARKS[status]
+                            for letter, status in zip(guess, letter_statuses)]
 
         # Check win condition
-        if guess == self.current_word:
+        if guess == target:
             self.won = True
             self.game_over = True
 
@@ -229,10 +248,15 @@ class WordGuruGame:
         """
         return self.game_over
 
-    def get_current_state(self) -> Dict[str, Any]:
+    def get_current_state(self, include_daily: bool = False) -> Dict[str, Any]:
         """
         Get current game state for display/testing.
 
+        Args:
+            include_daily: If True and in daily mode, also report the time
+                until the next daily word and whether the player has already
+                completed today's word (reads the scores file)
+
         Returns:
             Dictionary containing detailed current game state information
         """
@@ -250,8 +274,7 @@ class WordGuruGame:
         }
 
         # Add daily-specific information
-        if self.daily_mode:
-            from daily import time_until_next_daily, is_daily_completed
+        if include_daily and self.daily_mode:
             state["time_until_next_daily"] = time_until_next_daily()
             state["daily_completed"] = is_daily_completed(self.player, self.scores_path)
             state["today_date"] = str(datetime.datetime.now(timezone.utc).date())
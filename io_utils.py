@@ -10,8 +10,11 @@ __all__ = [
     'colorize', 'print_colored', 'clear_screen'
 ]
 
+import functools
+import os
+import string
 import sys
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 class Colors:
@@ -52,6 +55,20 @@ class Colors:
     INCORRECT = '\033[47m\033[30m'    # White background, black text
 
 
+_STATUS_COLORS: Dict[str, str] = {
+    "correct": Colors.CORRECT,
+    "present": Colors.PARTIAL,
+    "absent": Colors.INCORRECT
+}
+
+# Every (letter, status) pair the game can produce, formatted once up front
+_COLORED_LETTERS: Dict[Tuple[str, str], str] = {
+    (letter, status): f"{color} {letter} {Colors.RESET}"
+    for letter in string.ascii_uppercase
+    for status, color in _STATUS_COLORS.items()
+}
+
+
 def color_letter(letter: str, status: str) -> str:
     """
     Apply color formatting to a single letter based on its status.
@@ -63,14 +80,13 @@ def color_letter(letter: str, status: str) -> str:
     Returns:
         Formatted letter with color codes
     """
-    color_map = {
-        "correct": Colors.CORRECT,
-        "present": Colors.PARTIAL,
-        "absent": Colors.INCORRECT
-    }
+    letter = letter.upper()
 
-    color = color_map.get(status, Colors.RESET)
-    return f"{color} {letter.upper()} {Colors.RESET}"
+    colored = _COLORED_LETTERS.get((letter, status))
+    if colored is None:
+        color = _STATUS_COLORS.get(status, Colors.RESET)
+        colored = f"{color} {letter} {Colors.RESET}"
+    return colored
 
 
 def print_colored_word(word: str, status: List[str]) -> None:
@@ -80,21 +96,23 @@ def print_colored_word(word: str, status: List[str]) -> None:
     Args:
         word: Word to print (will be normalized to uppercase)
         status: List of status strings for each letter position
+
+    Raises:
+        ValueError: If word and status lengths differ (checked before printing)
     """
     if len(word) != len(status):
         raise ValueError("Word length must match status list length")
 
-    colored_letters = []
-    for letter, letter_status in zip(word.upper(), status):
-        colored_letters.append(color_letter(letter, letter_status))
-
-    print("".join(colored_letters))
+    print("".join(map(color_letter, word.upper(), status)))
 
 
 def load_words(path: str) -> List[str]:
     """
     Load words from a text file, filtering out comments and empty lines.
 
+    Parsed files are cached and reused while their modification time and
+    size are unchanged; every call returns a new list.
+
     Args:
         path: Path to the words file
 
@@ -105,14 +123,29 @@ def load_words(path: str) -> List[str]:
         FileNotFoundError: If the words file doesn't exist
         RuntimeError: If no valid words found or other loading errors
     """
+    try:
+        st = os.stat(path)
+    except OSError:
+        # Let the regular read report the missing or unreadable file
+        return _read_words(path)
+
+    return list(_read_words_cached(os.path.abspath(path), st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=128)
+def _read_words_cached(path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """Read a words file once per (path, mtime_ns, size) signature."""
+    return tuple(_read_words(path))
+
+
+def _read_words(path: str) -> List[str]:
+    """Read and parse a words file; see load_words."""
     try:
         with open(path, 'r', encoding='utf-8') as file:
-            words = []
-            for line in file:
-                line = line.strip().upper()
-                # Skip empty lines and comments
-                if line and not line.startswith('#'):
-                    words.append(line)
+            # Uppercase and split the whole buffer at once, then skip
+            # empty lines and comments
+            lines = (line.strip() for line in file.read().upper().splitlines())
+            words = [line for line in lines if line and not line.startswith('#')]
 
             if not words:
                 raise ValueError(f"No valid words found in {path}")
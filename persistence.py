@@ -3,24 +3,186 @@ Persistence layer for Word-Guru.
 
 Handles saving and loading of game statistics, scores,
 and player progress using JSON storage.
+
+Scores are stored either as a JSON array (``.json``) or as one JSON
+object per line (``.jsonl``). The line-based format lets new scores be
+appended without rewriting the whole file.
+
+Next to each scores file a small ``<name>.index.json`` sidecar records
+the latest score date per player, so daily completion checks don't need
+to read the whole score history.
 """
 
 __all__ = [
-    'load_scores', 'save_score', 'get_top_scores', 'create_score'
+    'Score', 'load_scores', 'save_score', 'get_top_scores', 'create_score',
+    'load_last_played'
 ]
 
+import contextlib
+import heapq
 import json
+import os
 import pathlib
+import sys
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+# Score file locks are held with the OS file locking API: fcntl on POSIX,
+# msvcrt on Windows
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+# orjson (or else ujson) is optional: when available it replaces the
+# stdlib json module for reading and writing score files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    try:
+        import ujson
+    except ImportError:
+        ujson = None
+else:
+    ujson = None
+
+# datetime.fromisoformat parses the trailing 'Z' of score dates natively
+# from Python 3.11; older versions need it rewritten as '+00:00'
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# Parsed scores per file, keyed by absolute path: ((mtime_ns, size), scores).
+# Bounded so long-running processes touching many files don't grow it forever
+_SCORES_CACHE_SIZE = 32
+_scores_cache: Dict[str, Tuple[Tuple[int, int], List[Dict[str, Any]]]] = {}
+
+
+if orjson is not None:
+    def _loads(data: bytes) -> Any:
+        """Parse UTF-8 encoded JSON."""
+        return orjson.loads(data)
+
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        """
+        Serialize an object to UTF-8 encoded JSON.
+
+        Args:
+            obj: Object to serialize
+            indent: If True, pretty-print with two-space indentation
+
+        Returns:
+            The JSON document as bytes, non-ASCII characters unescaped
+        """
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+elif ujson is not None:
+    def _loads(data: bytes) -> Any:
+        """Parse UTF-8 encoded JSON."""
+        return ujson.loads(data)
+
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize an object to UTF-8 encoded JSON (see the orjson version)."""
+        return ujson.dumps(obj, indent=2 if indent else 0, ensure_ascii=False,
+                           escape_forward_slashes=False).encode('utf-8')
+
+else:
+    def _loads(data: bytes) -> Any:
+        """Parse UTF-8 encoded JSON."""
+        return json.loads(data)
+
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize an object to UTF-8 encoded JSON (see the orjson version)."""
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+@dataclass(frozen=True)
+class Score:
+    """
+    A single validated game score.
+
+    Fields are type-checked once on creation, so a Score can be saved
+    without validating it again. Slots are declared by hand since
+    ``dataclass(slots=True)`` needs Python 3.10.
+
+    Raises:
+        ValueError: If a field has the wrong type or attempts is negative
+    """
+
+    __slots__ = ('player', 'word', 'attempts', 'won', 'date')
+
+    player: str
+    word: str
+    attempts: int
+    won: bool
+    date: str
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.player, str):
+            raise ValueError("Score 'player' must be a string")
+        if not isinstance(self.word, str):
+            raise ValueError("Score 'word' must be a string")
+        if not isinstance(self.attempts, int) or self.attempts < 0:
+            raise ValueError("Score 'attempts' must be a non-negative integer")
+        if not isinstance(self.won, bool):
+            raise ValueError("Score 'won' must be a boolean")
+        if not isinstance(self.date, str):
+            raise ValueError("Score 'date' must be a string")
+
+    @classmethod
+    def from_dict(cls, score: Dict[str, Any]) -> 'Score':
+        """
+        Build a Score from a score dictionary, validating it.
+
+        Args:
+            score: Score dictionary as stored in the scores file
+
+        Returns:
+            The validated Score
+
+        Raises:
+            ValueError: If score is not a dictionary or is invalid
+        """
+        if not isinstance(score, dict):
+            raise ValueError("Score must be a dictionary")
+
+        missing_fields = _SCORE_FIELDS - score.keys()
+        if missing_fields:
+            raise ValueError(f"Score missing required fields: {missing_fields}")
+
+        return cls(score["player"], score["word"], score["attempts"],
+                   score["won"], score["date"])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the score as a dictionary, in the scores file layout."""
+        return {
+            "player": self.player,
+            "word": self.word,
+            "attempts": self.attempts,
+            "won": self.won,
+            "date": self.date
+        }
+
+
+_SCORE_FIELDS = frozenset(Score.__slots__)
 
 
 def load_scores(path: Union[str, pathlib.Path]) -> List[Dict[str, Any]]:
     """
-    Load game scores from JSON file.
+    Load game scores from JSON or JSON Lines file.
+
+    A missing ``.jsonl`` file is read from a legacy ``.json`` file with
+    the same name, if one exists. Nothing is written: the migration itself
+    happens on the next save_score.
+
+    Parsed scores are cached per file and reused until the file's
+    modification time or size changes. The returned list and the score
+    dictionaries in it are fresh copies the caller may modify.
 
     Args:
-        path: Path to the scores JSON file
+        path: Path to the scores file (``.json`` or ``.jsonl``)
 
     Returns:
         List of score dictionaries. Returns empty list if file doesn't exist.
@@ -29,41 +191,111 @@ def load_scores(path: Union[str, pathlib.Path]) -> List[Dict[str, Any]]:
         RuntimeError: If file exists but contains invalid JSON
     """
     path = pathlib.Path(path)
+    cache_key = os.path.abspath(path)
 
-    if not path.exists():
-        return []
+    if _is_jsonl(path) and not path.exists():
+        legacy_path = path.with_suffix('.json')
+        if legacy_path.exists():
+            return load_scores(legacy_path)
 
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read().strip()
-
-        # Handle empty file
-        if not content:
-            return []
-
-        scores = json.loads(content)
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        _scores_cache.pop(cache_key, None)
+        return []
+    signature = (st.st_mtime_ns, st.st_size)
 
-        # Validate that we got a list
-        if not isinstance(scores, list):
-            raise ValueError("Score file should contain a list of scores")
+    # Reuse the parsed scores while the file is unchanged
+    cached = _scores_cache.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return _copy_scores(cached[1])
 
-        return scores
+    try:
+        if _is_jsonl(path):
+            with open(path, 'rb') as f:
+                scores = [_loads(line) for line in f if line.strip()]
+        else:
+            # Handle empty file
+            if st.st_size == 0:
+                return []
+
+            with open(path, 'rb') as f:
+                data = f.read()
+
+            try:
+                scores = _loads(data)
+            except ValueError:
+                # A file holding only whitespace counts as empty too
+                if data.strip():
+                    raise
+                scores = []
+
+            # Validate that we got a list
+            if not isinstance(scores, list):
+                raise ValueError("Score file should contain a list of scores")
 
     except (json.JSONDecodeError, ValueError) as e:
         raise RuntimeError(f"Error loading scores from {path}: {e}")
     except Exception as e:
         raise RuntimeError(f"Unexpected error loading scores from {path}: {e}")
 
+    _cache_scores(cache_key, signature, scores)
+    return _copy_scores(scores)
+
+
+def _copy_scores(scores: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Copy cached scores so callers can't change the cache through them."""
+    return [dict(score) if isinstance(score, dict) else score for score in scores]
+
+
+def _cache_scores(cache_key: str, signature: Tuple[int, int],
+                  scores: List[Dict[str, Any]]) -> None:
+    """Store parsed scores, evicting the least recently stored file if full."""
+    _scores_cache.pop(cache_key, None)
+    if len(_scores_cache) >= _SCORES_CACHE_SIZE:
+        del _scores_cache[next(iter(_scores_cache))]
+    _scores_cache[cache_key] = (signature, scores)
+
+
+def _is_jsonl(path: pathlib.Path) -> bool:
+    """Check whether a scores path uses the append-only JSON Lines format."""
+    return path.suffix.lower() == '.jsonl'
+
+
+def _migrate_legacy_scores(path: pathlib.Path) -> None:
+    """
+    Create a JSON Lines scores file from the legacy JSON file next to it.
+
+    The legacy file is left untouched. Does nothing if there is no
+    legacy file to migrate. Only called by save_score while it holds the
+    scores file lock, so two migrations can't truncate each other.
 
-def save_score(path: Union[str, pathlib.Path], score: Dict[str, Any]) -> None:
+    Args:
+        path: Path to the JSON Lines scores file to create
     """
-    Save a game score to JSON file.
+    legacy_path = path.with_suffix('.json')
+    if not legacy_path.exists():
+        return
+
+    scores = load_scores(legacy_path)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b''.join(_dumps(score) + b'\n' for score in scores))
+
+
+def save_score(path: Union[str, pathlib.Path], score: Union[Dict[str, Any], Score]) -> None:
+    """
+    Save a game score to JSON or JSON Lines file.
 
     Creates the file if it doesn't exist and appends the score to the list.
+    The score is appended in place as a single write: as one line for
+    ``.jsonl`` files, or as a new array element for ``.json`` files written
+    by this function. Other ``.json`` files are rewritten in full.
 
     Args:
-        path: Path to the scores JSON file
-        score: Score dictionary to save with structure:
+        path: Path to the scores file (``.json`` or ``.jsonl``)
+        score: Score (or score dictionary) to save, with structure:
                {
                    "player": str,     # player name or alias
                    "word": str,       # target word
@@ -78,45 +310,280 @@ def save_score(path: Union[str, pathlib.Path], score: Dict[str, Any]) -> None:
     """
     path = pathlib.Path(path)
 
-    # Validate score structure
-    required_fields = {"player", "word", "attempts", "won", "date"}
-    if not isinstance(score, dict):
-        raise ValueError("Score must be a dictionary")
-
-    missing_fields = required_fields - set(score.keys())
-    if missing_fields:
-        raise ValueError(f"Score missing required fields: {missing_fields}")
-
-    # Validate field types
-    if not isinstance(score["player"], str):
-        raise ValueError("Score 'player' must be a string")
-    if not isinstance(score["word"], str):
-        raise ValueError("Score 'word' must be a string")
-    if not isinstance(score["attempts"], int) or score["attempts"] < 0:
-        raise ValueError("Score 'attempts' must be a non-negative integer")
-    if not isinstance(score["won"], bool):
-        raise ValueError("Score 'won' must be a boolean")
-    if not isinstance(score["date"], str):
-        raise ValueError("Score 'date' must be a string")
+    # Validate score structure; a Score was validated when it was created
+    if isinstance(score, Score):
+        score = score.to_dict()
+    else:
+        Score.from_dict(score)
 
     try:
-        # Load existing scores
-        scores = load_scores(path)
-
-        # Add new score
-        scores.append(score)
-
         # Create parent directory if needed
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Save back to file
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(scores, f, indent=2, ensure_ascii=False)
+        with _score_file_lock(path):
+            signature_before = _file_signature(path)
+
+            if _is_jsonl(path):
+                _append_jsonl_score(path, score)
+            elif not _append_json_score(path, score):
+                # Load existing scores
+                scores = load_scores(path)
+
+                # Add new score; cache a copy so the caller's dict can't
+                # change the cached scores
+                scores.append(dict(score))
+
+                # Save back to file
+                with open(path, 'wb') as f:
+                    f.write(_dumps(scores, indent=True))
+
+                # Keep the in-memory copy in step with what was just written
+                _cache_scores(os.path.abspath(path), _file_signature(path), scores)
+
+            _update_score_index(path, score, signature_before)
 
     except Exception as e:
         raise RuntimeError(f"Error saving score to {path}: {e}")
 
 
+@contextlib.contextmanager
+def _score_file_lock(path: pathlib.Path, timeout: float = 5.0) -> Iterator[None]:
+    """
+    Hold an exclusive OS lock on ``<name>.lock`` while a scores file is written.
+
+    The lock file itself is left in place; only the lock on it matters.
+    The OS releases the lock when its holder exits, so a crashed process
+    never leaves a stale lock behind.
+
+    Args:
+        path: Path to the scores file to lock
+        timeout: Seconds to wait for the lock
+
+    Raises:
+        TimeoutError: If another writer holds the lock for too long
+    """
+    lock_path = path.with_name(path.name + '.lock')
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT)
+    try:
+        deadline = time.monotonic() + timeout
+        while not _try_lock(fd):
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Timed out waiting for lock {lock_path}")
+            time.sleep(0.01)
+
+        try:
+            yield
+        finally:
+            _unlock(fd)
+    finally:
+        os.close(fd)
+
+
+def _try_lock(fd: int) -> bool:
+    """Take an exclusive lock on an open lock file without blocking."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(fd: int) -> None:
+    """Release a lock taken with _try_lock."""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+def _append_json_score(path: pathlib.Path, score: Dict[str, Any]) -> bool:
+    """
+    Append a score to a pretty-printed JSON array file in place.
+
+    Files written by save_score end with the closing brace of the last
+    score followed by ``\n]``. The new score is written over that ``\n]``
+    with the same layout a full rewrite would produce, so the file
+    is never rewritten in full.
+
+    Unless the cache already holds the file as it is now, the file is
+    parsed first, so a corrupt file is refused instead of appended to.
+
+    Args:
+        path: Path to the JSON scores file
+        score: Validated score dictionary to append
+
+    Returns:
+        True if the score was appended, False if the file is missing or
+        doesn't end the expected way and must be rewritten instead
+    """
+    try:
+        f = open(path, 'r+b')
+    except FileNotFoundError:
+        return False
+
+    with f:
+        size = f.seek(0, os.SEEK_END)
+        if size < 3:
+            return False
+
+        f.seek(size - 3)
+        if f.read(3) != b'}\n]':
+            return False
+
+        signature_before = (os.fstat(f.fileno()).st_mtime_ns, size)
+
+        # Only append to a file known to hold a valid score list; parsing
+        # it also caches it, so later appends skip this step
+        cached = _scores_cache.get(os.path.abspath(path))
+        if cached is None or cached[0] != signature_before:
+            load_scores(path)
+
+        fragment = _dumps(score, indent=True).replace(b'\n', b'\n  ')
+        f.seek(size - 2)
+        f.write(b",\n  " + fragment + b"\n]")
+
+    _extend_cached_scores(path, score, signature_before)
+    return True
+
+
+def _append_jsonl_score(path: pathlib.Path, score: Dict[str, Any]) -> None:
+    """
+    Append a single score line to a JSON Lines scores file.
+
+    Args:
+        path: Path to the JSON Lines scores file
+        score: Validated score dictionary to append
+    """
+    if not path.exists():
+        _migrate_legacy_scores(path)
+
+    signature_before = _file_signature(path)
+
+    with open(path, 'ab') as f:
+        f.write(_dumps(score) + b'\n')
+
+    _extend_cached_scores(path, score, signature_before)
+
+
+def _extend_cached_scores(path: pathlib.Path, score: Dict[str, Any],
+                          signature_before: Optional[Tuple[int, int]]) -> None:
+    """
+    Add an appended score to the cache if it matched the file before the append.
+
+    A copy of the score is cached, so later changes to the caller's dict
+    don't leak into what load_scores returns.
+    """
+    cache_key = os.path.abspath(path)
+
+    cached = _scores_cache.pop(cache_key, None)
+    if cached is not None and cached[0] == signature_before:
+        cached[1].append(dict(score))
+        _cache_scores(cache_key, _file_signature(path), cached[1])
+
+
+def _file_signature(path: pathlib.Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for a file, or None if it doesn't exist."""
+    try:
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _index_path(path: pathlib.Path) -> pathlib.Path:
+    """
+    Return the sidecar index path for a scores file.
+
+    The full file name is kept, so ``scores.json`` and ``scores.jsonl``
+    in the same directory never share an index.
+    """
+    return path.with_name(path.name + '.index.json')
+
+
+def _read_score_index(path: pathlib.Path) -> Optional[Dict[str, Any]]:
+    """Read the sidecar index of a scores file, or None if unreadable."""
+    try:
+        with open(_index_path(path), 'rb') as f:
+            index = _loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(index, dict) or not isinstance(index.get("last_played"), dict):
+        return None
+    return index
+
+
+def _update_score_index(path: pathlib.Path, score: Dict[str, Any],
+                        signature_before: Optional[Tuple[int, int]]) -> None:
+    """
+    Record a newly saved score in the sidecar index of a scores file.
+
+    The index is updated in place if it matched the scores file before the
+    save, and rebuilt from the full score history otherwise. Failures are
+    ignored: a stale or missing index only makes lookups fall back to
+    scanning the scores file.
+
+    Args:
+        path: Path to the scores file that was just written
+        score: Score dictionary that was saved
+        signature_before: Signature of the scores file before the save
+    """
+    try:
+        index = _read_score_index(path)
+        if (index is not None and index.get("scores_file") == path.name
+                and index.get("signature") == list(signature_before or ())):
+            last_played = index["last_played"]
+            if score["date"] > last_played.get(score["player"], ""):
+                last_played[score["player"]] = score["date"]
+        else:
+            last_played = {}
+            for entry in load_scores(path):
+                player = entry.get("player")
+                date_str = entry.get("date", "")
+                if date_str > last_played.get(player, ""):
+                    last_played[player] = date_str
+
+        index = {
+            "scores_file": path.name,
+            "signature": list(_file_signature(path) or ()),
+            "last_played": last_played
+        }
+        with open(_index_path(path), 'wb') as f:
+            f.write(_dumps(index))
+
+    except (OSError, RuntimeError, ValueError, TypeError):
+        pass
+
+
+def load_last_played(path: Union[str, pathlib.Path]) -> Optional[Dict[str, str]]:
+    """
+    Get the latest score date per player from the sidecar index.
+
+    Args:
+        path: Path to the scores file
+
+    Returns:
+        Mapping of player name to the ISO date of their latest score, or
+        None if the index is missing or out of date with the scores file.
+    """
+    path = pathlib.Path(path)
+
+    signature = _file_signature(path)
+    if signature is None:
+        return None
+
+    index = _read_score_index(path)
+    if (index is None or index.get("scores_file") != path.name
+            or index.get("signature") != list(signature)):
+        return None
+
+    return index["last_played"]
+
+
 def get_top_scores(scores: List[Dict[str, Any]], limit: int = 10) -> List[Dict[str, Any]]:
     """
     Get top scores sorted by best performance.
@@ -134,27 +601,43 @@ def get_top_scores(scores: List[Dict[str, Any]], limit: int = 10) -> List[Dict[s
     if not scores:
         return []
 
-    def score_key(score: Dict[str, Any]) -> tuple:
-        """Sort key function for ranking scores."""
-        won = score.get("won", False)
-        attempts = score.get("attempts", float('inf'))
-        date_str = score.get("date", "")
+    # Compute each score's sort key once, parsing its date a single time
+    keys = list(map(_score_key, scores))
 
-        # Parse date for sorting (more recent first)
-        try:
+    # Only the best `limit` scores are needed, so avoid a full sort; rank
+    # indices by their precomputed keys instead of (key, score) pairs
+    top = heapq.nsmallest(limit, range(len(scores)), key=keys.__getitem__)
+    return [scores[i] for i in top]
+
+
+def _score_key(score: Dict[str, Any]) -> Tuple[bool, float, float]:
+    """
+    Build the ranking key of a score; smaller keys rank higher.
+
+    Args:
+        score: Score dictionary
+
+    Returns:
+        Tuple for sorting:
+        - Won games first (False < True, so negate for reverse)
+        - Fewer attempts first (ascending)
+        - More recent date first (negate timestamp for reverse)
+    """
+    return (not score.get("won", False),
+            score.get("attempts", float('inf')),
+            -_date_timestamp(score.get("date", "")))
+
+
+def _date_timestamp(date_str: str) -> float:
+    """Parse an ISO 8601 score date into a timestamp for ranking."""
+    try:
+        if _FROMISOFORMAT_ACCEPTS_Z:
+            date_obj = datetime.fromisoformat(date_str)
+        else:
             date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-        except (ValueError, AttributeError):
-            date_obj = datetime.min
-
-        # Return tuple for sorting:
-        # - Won games first (False < True, so negate for reverse)
-        # - Fewer attempts first (ascending)
-        # - More recent date first (negate timestamp for reverse)
-        return (not won, attempts, -date_obj.timestamp())
-
-    # Sort and limit
-    sorted_scores = sorted(scores, key=score_key)
-    return sorted_scores[:limit]
+    except (ValueError, AttributeError, TypeError):
+        date_obj = datetime.min
+    return date_obj.timestamp()
 
 
 def create_score(player: str, word: str, attempts: int, won: bool) -> Dict[str, Any]:
@@ -0,0 +1,13 @@
+"""
+Shared pytest configuration for Word-Guru tests.
+
+Makes the project modules importable from the repository root once per
+session (and once per xdist worker).
+"""
+
+import pathlib
+import sys
+
+_ROOT = str(pathlib.Path(__file__).resolve().parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
@@ -0,0 +1,26 @@
+"""
+Shared helpers for Word-Guru tests.
+"""
+
+import pathlib
+import tempfile
+import unittest
+
+
+class ScratchDirTestCase(unittest.TestCase):
+    """Base class giving each test class one scratch directory."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the scratch directory shared by the class."""
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.tmp = pathlib.Path(cls._tmp.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the scratch directory and every file in it."""
+        cls._tmp.cleanup()
+
+    def _tmp_path(self, suffix: str = ".json") -> pathlib.Path:
+        """Return a scratch file path unique to the running test."""
+        return self.tmp / f"{self._testMethodName}{suffix}"
@@ -4,35 +4,69 @@ Core functionality tests for Word-Guru.
 Tests the basic game mechanics, word loading, and color utilities.
 """
 
+import contextlib
+import copy
+import io
 import unittest
 import tempfile
 import os
 from typing import List
-
-# Import modules to test
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from unittest.mock import mock_open, patch
 
 from game import WordGuruGame
 from io_utils import color_letter, load_words, print_colored_word
 from persistence import load_scores, save_score
 
+from tests.helpers import ScratchDirTestCase
+
+# Words file with comments, indentation and blank lines for load_words
+_LOAD_WORDS_CONTENT = """# Test words file
+                APPLE
+                GRAPE
+                # Another comment
+                PEACH
+
+                # Empty line above should be ignored
+                LEMON
+            """
+_EXPECTED_LOAD_WORDS = ["APPLE", "GRAPE", "PEACH", "LEMON"]
+
 
 class TestWordGuruGame(unittest.TestCase):
     """Test cases for WordGuruGame class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build a template game once; tests that mutate it work on a copy."""
+        cls.TEST_WORDS = ("APPLE", "GRAPE", "PEACH")
+        cls._template_game = WordGuruGame(list(cls.TEST_WORDS), scores_path=None)
+
+    def _game_with_word(self, word: str, **kwargs) -> WordGuruGame:
+        """Start a game (without persistence) whose only possible target is `word`."""
+        game = WordGuruGame([word], scores_path=None, **kwargs)
+        game.start_game()
+        return game
+
     def test_game_instantiation(self):
         """Test that WordGuruGame can be instantiated without errors with a list of 3 words."""
-        test_words = ["APPLE", "GRAPE", "PEACH"]
-        game = WordGuruGame(test_words)
+        game = self._template_game
 
-        self.assertEqual(game.word_list, test_words)
+        self.assertEqual(game.word_list, list(self.TEST_WORDS))
         self.assertEqual(game.max_attempts, 6)  # default value
         self.assertIsNone(game.current_word)
         self.assertEqual(game.attempts, [])
         self.assertFalse(game.game_over)
         self.assertFalse(game.won)
 
+    def test_game_instantiation_normalizes_words(self):
+        """Test that words are uppercased and stripped unless already normalized."""
+        game = WordGuruGame([" apple ", "Grape"])
+        self.assertEqual(game.word_list, ["APPLE", "GRAPE"])
+
+        words = ["APPLE", "GRAPE"]
+        game = WordGuruGame(words, _normalized=True)
+        self.assertIs(game.word_list, words)
+
     def test_game_instantiation_custom_attempts(self):
         """Test game instantiation with custom max attempts."""
         test_words = ["APPLE", "GRAPE", "PEACH"]
@@ -42,13 +76,12 @@ class TestWordGuruGame(unittest.TestCase):
 
     def test_start_game(self):
         """Test that start_game initializes the game properly."""
-        test_words = ["APPLE", "GRAPE", "PEACH"]
-        game = WordGuruGame(test_words)
+        game = copy.copy(self._template_game)
 
         game.start_game()
 
         self.assertIsNotNone(game.current_word)
-        self.assertIn(game.current_word, test_words)
+        self.assertIn(game.current_word, self.TEST_WORDS)
         self.assertEqual(game.attempts, [])
         self.assertFalse(game.game_over)
         self.assertFalse(game.won)
@@ -75,8 +108,7 @@ class TestWordGuruGame(unittest.TestCase):
 
     def test_check_guess_without_start(self):
         """Test that check_guess raises error when game not started."""
-        test_words = ["APPLE", "GRAPE", "PEACH"]
-        game = WordGuruGame(test_words)
+        game = self._template_game
 
         with self.assertRaises(RuntimeError) as context:
             game.check_guess("APPLE")
@@ -84,25 +116,20 @@ class TestWordGuruGame(unittest.TestCase):
 
     def test_check_guess_returns_proper_types(self):
         """Test that check_guess returns two lists with appropriate length."""
-        test_words = ["APPLE"]
-        game = WordGuruGame(test_words)
-        game.start_game()
+        game = self._game_with_word("APPLE")
 
         letter_statuses, feedback_summary = game.check_guess("GRAPE")
 
         self.assertIsInstance(letter_statuses, list)
         self.assertIsInstance(feedback_summary, list)
-        self.assertEqual(len(letter_statuses), 5)  # Should match word length
-        self.assertEqual(len(feedback_summary), 5)  # Should match word length
-        self.assertTrue(all(isinstance(status, str) for status in letter_statuses))
-        self.assertTrue(all(isinstance(feedback, str) for feedback in feedback_summary))
+        # Both should match word length
+        self.assertEqual([len(letter_statuses), len(feedback_summary)], [5, 5])
+        self.assertEqual({type(status) for status in letter_statuses}, {str})
+        self.assertEqual({type(feedback) for feedback in feedback_summary}, {str})
 
     def test_check_guess_exact_match(self):
         """Test check_guess with exact word match."""
-        test_words = ["APPLE"]
-        game = WordGuruGame(test_words)
-        game.current_word = "APPLE"  # Force specific word for testing
-        game.attempts = []
+        game = self._game_with_word("APPLE")
 
         letter_statuses, feedback_summary = game.check_guess("APPLE")
 
@@ -114,10 +141,7 @@ class TestWordGuruGame(unittest.TestCase):
 
     def test_check_guess_partial_match(self):
         """Test check_guess with partial matches."""
-        test_words = ["APPLE"]
-        game = WordGuruGame(test_words)
-        game.current_word = "APPLE"
-        game.attempts = []
+        game = self._game_with_word("APPLE")
 
         letter_statuses, feedback_summary = game.check_guess("PLANE")
 
@@ -134,11 +158,49 @@ class TestWordGuruGame(unittest.TestCase):
         self.assertFalse(game.won)
         self.assertFalse(game.game_over)
 
+    def test_check_guess_normalizes_input(self):
+        """Test that guesses are uppercased and stripped before scoring."""
+        game = self._game_with_word("APPLE")
+
+        letter_statuses, _ = game.check_guess("  apple\n")
+
+        self.assertEqual(letter_statuses, ["correct"] * 5)
+        self.assertEqual(game.attempts, ["APPLE"])
+
+    def test_check_guess_rejects_non_letters(self):
+        """Test that guesses with digits or punctuation are rejected."""
+        game = self._game_with_word("APPLE")
+
+        for guess in ("APPL3", "APP-E"):
+            with self.assertRaises(ValueError) as context:
+                game.check_guess(guess)
+            self.assertIn("only letters", str(context.exception))
+        self.assertEqual(game.attempts, [])
+
+    def test_check_guess_keeps_inner_whitespace(self):
+        """Test that whitespace inside a guess is not dropped."""
+        game = self._game_with_word("APPLE")
+
+        with self.assertRaises(ValueError):
+            game.check_guess("AP PLE")
+        self.assertEqual(game.attempts, [])
+
+    def test_check_guess_accented_word(self):
+        """Test that words with accented letters are accepted and scored."""
+        game = self._game_with_word("ÁRBOL")
+
+        letter_statuses, feedback = game.check_guess("LÁPIZ")
+
+        self.assertEqual(letter_statuses, ["present", "present", "absent", "absent", "absent"])
+        self.assertEqual(feedback[1], "Á~")
+
+        letter_statuses, _ = game.check_guess("árbol")
+        self.assertEqual(letter_statuses, ["correct"] * 5)
+        self.assertTrue(game.won)
+
     def test_max_attempts_reached(self):
         """Test that game ends when max attempts reached."""
-        test_words = ["APPLE"]
-        game = WordGuruGame(test_words, max_attempts=2)
-        game.start_game()
+        game = self._game_with_word("APPLE", max_attempts=2)
 
         # Make two wrong guesses
         game.check_guess("WRONG")
@@ -150,9 +212,7 @@ class TestWordGuruGame(unittest.TestCase):
 
     def test_is_finished(self):
         """Test is_finished method."""
-        test_words = ["APPLE"]
-        game = WordGuruGame(test_words)
-        game.start_game()
+        game = self._game_with_word("APPLE")
 
         self.assertFalse(game.is_finished())
 
@@ -162,11 +222,8 @@ class TestWordGuruGame(unittest.TestCase):
 
     def test_get_current_state(self):
         """Test get_current_state returns proper dictionary."""
-        test_words = ["APPLE", "GRAPE", "PEACH"]
-        game = WordGuruGame(test_words, max_attempts=6)
-        game.start_game()
-
-        state = game.get_current_state()
+        # The checked fields do not depend on the target, so no game is started
+        state = self._template_game.get_current_state()
 
         self.assertIsInstance(state, dict)
         self.assertIn("current_word", state)
@@ -181,6 +238,19 @@ class TestWordGuruGame(unittest.TestCase):
         self.assertFalse(state["game_over"])
         self.assertFalse(state["won"])
 
+    def test_get_current_state_daily_info_is_opt_in(self):
+        """Test that daily information is only reported when requested."""
+        game = copy.copy(self._template_game)
+        game.daily_mode = True
+
+        state = game.get_current_state()
+        self.assertNotIn("daily_completed", state)
+
+        state = game.get_current_state(include_daily=True)
+        self.assertFalse(state["daily_completed"])
+        self.assertIn("time_until_next_daily", state)
+        self.assertIn("today_date", state)
+
 
 class TestIOUtils(unittest.TestCase):
     """Test cases for I/O utility functions."""
@@ -210,32 +280,33 @@ class TestIOUtils(unittest.TestCase):
 
     def test_print_colored_word_length_mismatch(self):
         """Test that print_colored_word raises error for mismatched lengths."""
-        with self.assertRaises(ValueError) as context:
+        output = io.StringIO()
+        with self.assertRaises(ValueError) as context, contextlib.redirect_stdout(output):
             print_colored_word("HELLO", ["correct", "present"])  # 5 letters, 2 statuses
         self.assertIn("Word length must match status list length", str(context.exception))
+        self.assertEqual(output.getvalue(), "")  # Validated before anything is printed
 
     def test_load_words_with_test_data(self):
-        """Test load_words function with temporary test file."""
-        # Create temporary words file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as tmp_file:
-            test_content = """# Test words file
-                APPLE
-                GRAPE
-                # Another comment
-                PEACH
+        """Test load_words parses words, comments and blank lines."""
+        with patch("io_utils.open", mock_open(read_data=_LOAD_WORDS_CONTENT), create=True):
+            words = load_words("in_memory_words.txt")
 
-                # Empty line above should be ignored
-                LEMON
-            """
-            tmp_file.write(test_content)
-            tmp_file_path = tmp_file.name
+        self.assertListEqual(words, _EXPECTED_LOAD_WORDS)
 
-        try:
-            words = load_words(tmp_file_path)
-            expected_words = ["APPLE", "GRAPE", "PEACH", "LEMON"]
-            self.assertEqual(words, expected_words)
-        finally:
-            os.unlink(tmp_file_path)  # Clean up
+    def test_load_words_cache_tracks_file_changes(self):
+        """Test that cached words are copied and refreshed when the file changes."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            words_path = os.path.join(tmp_dir, "words.txt")
+            with open(words_path, "w", encoding="utf-8") as f:
+                f.write("APPLE\nGRAPE\n")
+
+            first = load_words(words_path)
+            first.append("PEACH")
+            self.assertEqual(load_words(words_path), ["APPLE", "GRAPE"])
+
+            with open(words_path, "w", encoding="utf-8") as f:
+                f.write("LEMON\nMANGO\nPEACH\n")
+            self.assertEqual(load_words(words_path), ["LEMON", "MANGO", "PEACH"])
 
     def test_load_words_file_not_found(self):
         """Test load_words with non-existent file."""
@@ -244,19 +315,15 @@ class TestIOUtils(unittest.TestCase):
 
     def test_load_words_empty_file(self):
         """Test load_words with empty file (only comments)."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as tmp_file:
-            tmp_file.write("# Only comments\n# No actual words\n")
-            tmp_file_path = tmp_file.name
+        test_content = "# Only comments\n# No actual words\n"
 
-        try:
+        with patch("io_utils.open", mock_open(read_data=test_content), create=True):
             with self.assertRaises(RuntimeError) as context:
-                load_words(tmp_file_path)
-            self.assertIn("No valid words found", str(context.exception))
-        finally:
-            os.unlink(tmp_file_path)  # Clean up
+                load_words("in_memory_words.txt")
+        self.assertIn("No valid words found", str(context.exception))
 
 
-class TestPersistence(unittest.TestCase):
+class TestPersistence(ScratchDirTestCase):
     """Test cases for persistence module stubs."""
 
     def test_load_scores_returns_list(self):
@@ -276,22 +343,15 @@ class TestPersistence(unittest.TestCase):
             "date": "2024-01-01T12:00:00Z"
         }
 
-        # Use a proper temporary directory to avoid empty file issues
-        import tempfile
-        import pathlib
-
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            scores_path = pathlib.Path(tmp_dir) / "test_scores.json"
-
-            try:
-                save_score(scores_path, test_score)
-                # Verify the score was saved
-                scores = load_scores(scores_path)
-                self.assertEqual(len(scores), 1)
-                self.assertEqual(scores[0], test_score)
-            except Exception as e:
-                self.fail(f"save_score raised an unexpected exception: {e}")
+        # Each test gets its own file in the class directory
+        scores_path = self._tmp_path()
 
+        try:
+            save_score(scores_path, test_score)
+            # Verify the score was saved
+            scores = load_scores(scores_path)
+            self.assertEqual(len(scores), 1)
+            self.assertEqual(scores[0], test_score)
+        except Exception as e:
+            self.fail(f"save_score raised an unexpected exception: {e}")
 
-if __name__ == "__main__":
-    unittest.main(verbosity=2)
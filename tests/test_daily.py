@@ -6,41 +6,75 @@ and time-based utilities.
 """
 
 import unittest
-import tempfile
 import json
-import os
 from datetime import datetime, date, timezone, timedelta
-
-# Import modules to test
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from types import MappingProxyType
+from unittest.mock import patch
 
 from daily import (
-    select_daily_word, is_daily_completed, get_next_daily_reset,
+    _daily_seed, select_daily_word, is_daily_completed, get_next_daily_reset,
     time_until_next_daily
 )
+from persistence import create_score, save_score
+
+from tests.helpers import ScratchDirTestCase
+
+# Fixed date shared by the word selection tests
+_TEST_DATE = date(2024, 6, 15)
+
+# Score timestamps, formatted once at import
+_NOW_UTC = datetime.now(timezone.utc)
+_NOW_ISO_Z = _NOW_UTC.isoformat().replace('+00:00', 'Z')
+_YESTERDAY_ISO_Z = (_NOW_UTC - timedelta(days=1)).isoformat().replace('+00:00', 'Z')
+
+
+# Read-only score templates; the JSON below is derived from them once, so
+# they are frozen to keep the two from drifting apart
+_OTHER_PLAYER_SCORE = MappingProxyType({
+    "player": "otherplayer", "word": "APPLE", "attempts": 3, "won": True, "date": _NOW_ISO_Z
+})
+_TODAY_SCORE = MappingProxyType({
+    "player": "testplayer", "word": "APPLE", "attempts": 4, "won": True, "date": _NOW_ISO_Z
+})
+_OLD_SCORE = MappingProxyType({
+    "player": "testplayer", "word": "APPLE", "attempts": 3, "won": True, "date": _YESTERDAY_ISO_Z
+})
+
+# Scores file contents for each template, encoded once
+_OTHER_PLAYER_JSON = json.dumps([dict(_OTHER_PLAYER_SCORE)]).encode()
+_TODAY_SCORE_JSON = json.dumps([dict(_TODAY_SCORE)]).encode()
+_OLD_SCORE_JSON = json.dumps([dict(_OLD_SCORE)]).encode()
+
+# (case, scores file contents or None for a missing file, expected result)
+_COMPLETION_CASES = (
+    ("no_file", None, False),
+    ("empty", b"[]", False),
+    ("other_player", _OTHER_PLAYER_JSON, False),
+    ("today", _TODAY_SCORE_JSON, True),
+    ("old", _OLD_SCORE_JSON, False),
+)
 
 
-class TestSelectDailyWord(unittest.TestCase):
-    """Test cases for select_daily_word function."""
+class TestDaily(unittest.TestCase):
+    """Test cases for daily word selection and time utilities."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.test_words = ["APPLE", "GRAPE", "PEACH", "LEMON"]
-        self.test_date = date(2024, 6, 15)
+    @classmethod
+    def setUpClass(cls):
+        """Set up read-only test fixtures once for the class."""
+        cls.test_words = ["APPLE", "GRAPE", "PEACH", "LEMON"]
 
     def test_same_date_same_word(self):
         """Test that same date always returns same word."""
-        word1 = select_daily_word(self.test_words, self.test_date)
-        word2 = select_daily_word(self.test_words, self.test_date)
+        word1 = select_daily_word(self.test_words, _TEST_DATE)
+        word2 = select_daily_word(self.test_words, _TEST_DATE)
 
         self.assertEqual(word1, word2)
         self.assertIn(word1, self.test_words)
 
     def test_different_dates_can_have_different_words(self):
         """Test that different dates can produce different words."""
-        date1 = date(2024, 6, 15)
-        date2 = date(2024, 6, 16)
+        date1 = _TEST_DATE
+        date2 = _TEST_DATE + timedelta(days=1)
 
         word1 = select_daily_word(self.test_words, date1)
         word2 = select_daily_word(self.test_words, date2)
@@ -54,31 +88,32 @@ class TestSelectDailyWord(unittest.TestCase):
 
     def test_deterministic_across_multiple_calls(self):
         """Test deterministic behavior across multiple calls."""
-        results = []
-        for _ in range(10):
-            word = select_daily_word(self.test_words, self.test_date)
-            results.append(word)
+        # Clear the seed cache in between so both calls compute the word from
+        # scratch; repeating cached calls would only test the cache
+        _daily_seed.cache_clear()
+        word1 = select_daily_word(self.test_words, _TEST_DATE)
+        _daily_seed.cache_clear()
+        word2 = select_daily_word(self.test_words, _TEST_DATE)
 
-        # All results should be identical
-        self.assertTrue(all(word == results[0] for word in results))
+        self.assertEqual(word1, word2)
 
     def test_empty_word_list_raises_error(self):
         """Test that empty word list raises ValueError."""
         with self.assertRaises(ValueError) as context:
-            select_daily_word([], self.test_date)
+            select_daily_word([], _TEST_DATE)
         self.assertIn("cannot be empty", str(context.exception))
 
     def test_single_word_list(self):
         """Test behavior with single word list."""
         single_word = ["TIGER"]
-        word = select_daily_word(single_word, self.test_date)
+        word = select_daily_word(single_word, _TEST_DATE)
 
         self.assertEqual(word, "TIGER")
 
     def test_word_normalization(self):
         """Test that words are properly normalized to uppercase."""
         mixed_case_words = ["apple", "Grape", "PEACH"]
-        word = select_daily_word(mixed_case_words, self.test_date)
+        word = select_daily_word(mixed_case_words, _TEST_DATE)
 
         # Result should be uppercase
         self.assertTrue(word.isupper())
@@ -89,21 +124,18 @@ class TestSelectDailyWord(unittest.TestCase):
         list1 = ["APPLE", "GRAPE"]
         list2 = ["TIGER", "WHALE"]
 
-        word1 = select_daily_word(list1, self.test_date)
-        word2 = select_daily_word(list2, self.test_date)
+        word1 = select_daily_word(list1, _TEST_DATE)
+        word2 = select_daily_word(list2, _TEST_DATE)
 
         self.assertIn(word1, list1)
         self.assertIn(word2, list2)
 
     def test_default_date_uses_today(self):
         """Test that default date parameter uses today."""
-        # This test just ensures the function doesn't crash when no date provided
-        word = select_daily_word(self.test_words)
-        self.assertIn(word, self.test_words)
-
-
-class TestDailyTimeUtils(unittest.TestCase):
-    """Test cases for daily time utility functions."""
+        # Freeze the clock so the result can be compared with an explicit date
+        with patch("daily._today_utc", return_value=_TEST_DATE):
+            word = select_daily_word(self.test_words)
+        self.assertEqual(word, select_daily_word(self.test_words, _TEST_DATE))
 
     def test_get_next_daily_reset(self):
         """Test that next daily reset is calculated correctly."""
@@ -133,8 +165,17 @@ class TestDailyTimeUtils(unittest.TestCase):
         # Should contain time units (h, m, or s)
         self.assertTrue(any(unit in time_str for unit in ['h', 'm', 's']))
 
+    def test_time_until_next_daily_with_given_now(self):
+        """Test countdown formatting for fixed points in the day."""
+        day = datetime(2024, 6, 15, tzinfo=timezone.utc)
+
+        self.assertEqual(time_until_next_daily(day.replace(hour=22, minute=30, second=15)), "1h 29m")
+        self.assertEqual(time_until_next_daily(day.replace(hour=23, minute=58)), "2m 0s")
+        self.assertEqual(time_until_next_daily(day.replace(hour=23, minute=59, second=30)), "30s")
+        self.assertEqual(get_next_daily_reset(day.replace(hour=12)), datetime(2024, 6, 16, tzinfo=timezone.utc))
 
-class TestDailyCompletion(unittest.TestCase):
+
+class TestDailyCompletion(ScratchDirTestCase):
     """Test cases for daily completion tracking."""
 
     def test_is_daily_completed_no_scores_path(self):
@@ -142,99 +183,32 @@ class TestDailyCompletion(unittest.TestCase):
         result = is_daily_completed("testplayer", None)
         self.assertFalse(result)
 
-    def test_is_daily_completed_no_file(self):
-        """Test completion check when scores file doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            non_existent_path = os.path.join(tmp_dir, "nonexistent.json")
-            result = is_daily_completed("testplayer", non_existent_path)
-            self.assertFalse(result)
-
-    def test_is_daily_completed_empty_file(self):
-        """Test completion check with empty scores file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp_file:
-            json.dump([], tmp_file)
-            tmp_file_path = tmp_file.name
-
-        try:
-            result = is_daily_completed("testplayer", tmp_file_path)
-            self.assertFalse(result)
-        finally:
-            os.unlink(tmp_file_path)
-
-    def test_is_daily_completed_no_scores_for_player(self):
-        """Test completion check when player has no scores."""
-        other_player_score = {
-            "player": "otherplayer",
-            "word": "APPLE",
-            "attempts": 3,
-            "won": True,
-            "date": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
-        }
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp_file:
-            json.dump([other_player_score], tmp_file)
-            tmp_file_path = tmp_file.name
-
-        try:
-            result = is_daily_completed("testplayer", tmp_file_path)
-            self.assertFalse(result)
-        finally:
-            os.unlink(tmp_file_path)
-
-    def test_is_daily_completed_with_today_score(self):
-        """Test completion check with today's score."""
-        today_score = {
-            "player": "testplayer",
-            "word": "APPLE",
-            "attempts": 4,
-            "won": True,
-            "date": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
-        }
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp_file:
-            json.dump([today_score], tmp_file)
-            tmp_file_path = tmp_file.name
-
-        try:
-            result = is_daily_completed("testplayer", tmp_file_path)
-            self.assertTrue(result)
-        finally:
-            os.unlink(tmp_file_path)
-
-    def test_is_daily_completed_with_old_score(self):
-        """Test completion check with old score."""
-        yesterday = datetime.now(timezone.utc) - timedelta(days=1)
-        old_score = {
-            "player": "testplayer",
-            "word": "APPLE",
-            "attempts": 3,
-            "won": True,
-            "date": yesterday.isoformat().replace('+00:00', 'Z')
-        }
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp_file:
-            json.dump([old_score], tmp_file)
-            tmp_file_path = tmp_file.name
-
-        try:
-            result = is_daily_completed("testplayer", tmp_file_path)
-            self.assertFalse(result)
-        finally:
-            os.unlink(tmp_file_path)
+    def test_is_daily_completed_cases(self):
+        """Test completion checks against missing, empty, foreign and old score files."""
+        for case, contents, expected in _COMPLETION_CASES:
+            with self.subTest(case=case):
+                scores_path = self.tmp / f"{case}.json"
+                if contents is not None:
+                    with open(scores_path, "wb") as f:
+                        f.write(contents)
 
-    def test_is_daily_completed_invalid_json(self):
-        """Test completion check with invalid JSON file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp_file:
-            tmp_file.write("invalid json")
-            tmp_file_path = tmp_file.name
+                self.assertEqual(is_daily_completed("testplayer", scores_path), expected)
 
-        try:
+    def test_is_daily_completed_invalid_json(self):
+        """Test completion check when the scores file cannot be parsed."""
+        # load_scores reports invalid JSON as RuntimeError; raise it directly
+        parse_error = RuntimeError("Error loading scores from in_memory_scores.json")
+        with patch("daily.load_scores", side_effect=parse_error):
             # Should not crash, should return False
-            result = is_daily_completed("testplayer", tmp_file_path)
-            self.assertFalse(result)
-        finally:
-            os.unlink(tmp_file_path)
+            self.assertFalse(is_daily_completed("testplayer", "in_memory_scores.json"))
+
+    def test_is_daily_completed_after_save_score(self):
+        """Test completion check against a scores file written by save_score."""
+        scores_path = self._tmp_path(".jsonl")
+
+        save_score(scores_path, create_score("otherplayer", "APPLE", 3, True))
+        self.assertFalse(is_daily_completed("testplayer", scores_path))
 
+        save_score(scores_path, create_score("testplayer", "APPLE", 4, True))
+        self.assertTrue(is_daily_completed("testplayer", scores_path))
 
-if __name__ == "__main__":
-    unittest.main(verbosity=2)
@@ -5,44 +5,48 @@ Tests JSON score loading, saving, and ranking functionality.
 """
 
 import unittest
-import tempfile
-import pathlib
 import json
 import os
+import time
 from datetime import datetime, timedelta, timezone
 
-# Import modules to test
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from persistence import (
-    load_scores, save_score, get_top_scores, create_score
+    Score, load_scores, save_score, get_top_scores, create_score, load_last_played,
+    _score_file_lock
 )
 
+from tests.helpers import ScratchDirTestCase
+
 
-class TestLoadScores(unittest.TestCase):
+class TestLoadScores(ScratchDirTestCase):
     """Test cases for load_scores function."""
 
     def test_load_scores_nonexistent_file(self):
         """Test that load_scores returns empty list if JSON file doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            non_existent_path = pathlib.Path(tmp_dir) / "nonexistent.json"
-            scores = load_scores(non_existent_path)
+        non_existent_path = self._tmp_path()
+        scores = load_scores(non_existent_path)
 
-            self.assertEqual(scores, [])
-            self.assertIsInstance(scores, list)
+        self.assertEqual(scores, [])
+        self.assertIsInstance(scores, list)
 
     def test_load_scores_empty_file(self):
         """Test loading from an empty JSON file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp_file:
-            json.dump([], tmp_file)
-            tmp_file_path = tmp_file.name
+        tmp_file_path = self._tmp_path()
+        tmp_file_path.write_text(json.dumps([]))
+
+        scores = load_scores(tmp_file_path)
+        self.assertEqual(scores, [])
+
+    def test_load_scores_whitespace_only_file(self):
+        """Test that a JSON file holding only whitespace loads as empty and can be saved to."""
+        tmp_file_path = self._tmp_path()
+        tmp_file_path.write_text("\n")
 
-        try:
-            scores = load_scores(tmp_file_path)
-            self.assertEqual(scores, [])
-        finally:
-            os.unlink(tmp_file_path)
+        self.assertEqual(load_scores(tmp_file_path), [])
+
+        score = create_score("alice", "APPLE", 3, True)
+        save_score(tmp_file_path, score)
+        self.assertEqual(load_scores(tmp_file_path), [score])
 
     def test_load_scores_valid_data(self):
         """Test loading valid score data from JSON file."""
@@ -63,44 +67,84 @@ class TestLoadScores(unittest.TestCase):
             }
         ]
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp_file:
-            json.dump(test_scores, tmp_file)
-            tmp_file_path = tmp_file.name
+        tmp_file_path = self._tmp_path()
+        tmp_file_path.write_text(json.dumps(test_scores))
 
-        try:
-            scores = load_scores(tmp_file_path)
-            self.assertEqual(scores, test_scores)
-        finally:
-            os.unlink(tmp_file_path)
+        scores = load_scores(tmp_file_path)
+        self.assertEqual(scores, test_scores)
 
     def test_load_scores_invalid_json(self):
         """Test that load_scores raises RuntimeError for invalid JSON."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp_file:
-            tmp_file.write("invalid json content")
-            tmp_file_path = tmp_file.name
+        tmp_file_path = self._tmp_path()
+        tmp_file_path.write_text("invalid json content")
 
-        try:
-            with self.assertRaises(RuntimeError) as context:
-                load_scores(tmp_file_path)
-            self.assertIn("Error loading scores", str(context.exception))
-        finally:
-            os.unlink(tmp_file_path)
+        with self.assertRaises(RuntimeError) as context:
+            load_scores(tmp_file_path)
+        self.assertIn("Error loading scores", str(context.exception))
 
     def test_load_scores_wrong_data_type(self):
         """Test that load_scores raises RuntimeError if file contains non-list."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp_file:
-            json.dump({"not": "a list"}, tmp_file)
-            tmp_file_path = tmp_file.name
+        tmp_file_path = self._tmp_path()
+        tmp_file_path.write_text(json.dumps({"not": "a list"}))
+
+        with self.assertRaises(RuntimeError) as context:
+            load_scores(tmp_file_path)
+        self.assertIn("should contain a list", str(context.exception))
+
+    def test_load_scores_jsonl_reads_legacy_json(self):
+        """Test that a missing .jsonl file is read from, then migrated from, the legacy .json file."""
+        legacy_score = {
+            "player": "legacy",
+            "word": "HORSE",
+            "attempts": 2,
+            "won": True,
+            "date": "2024-01-01T10:00:00Z"
+        }
+
+        legacy_path = self._tmp_path()
+        jsonl_path = self._tmp_path(".jsonl")
+        legacy_path.write_text(json.dumps([legacy_score]), encoding='utf-8')
+
+        scores = load_scores(jsonl_path)
+
+        # Reading never writes; the first save migrates the legacy scores
+        self.assertEqual(scores, [legacy_score])
+        self.assertFalse(jsonl_path.exists())
 
-        try:
-            with self.assertRaises(RuntimeError) as context:
-                load_scores(tmp_file_path)
-            self.assertIn("should contain a list", str(context.exception))
-        finally:
-            os.unlink(tmp_file_path)
+        new_score = create_score("alice", "APPLE", 3, True)
+        save_score(jsonl_path, new_score)
 
+        self.assertEqual(load_scores(jsonl_path), [legacy_score, new_score])
+        self.assertTrue(legacy_path.exists())
 
-class TestSaveScore(unittest.TestCase):
+    def test_load_scores_returns_copies(self):
+        """Test that changing loaded scores doesn't change later loads."""
+        score = create_score("alice", "APPLE", 3, True)
+        tmp_file_path = self._tmp_path()
+        tmp_file_path.write_text(json.dumps([score]), encoding='utf-8')
+
+        scores = load_scores(tmp_file_path)
+        scores[0]["attempts"] = 99
+        scores.append(score)
+
+        self.assertEqual(load_scores(tmp_file_path), [score])
+
+    def test_load_scores_cache_detects_same_mtime_rewrite(self):
+        """Test that a rewrite keeping the modification time is still reloaded."""
+        scores_path = self._tmp_path()
+        scores_path.write_text(json.dumps([]))
+        mtime_ns = scores_path.stat().st_mtime_ns
+
+        self.assertEqual(load_scores(scores_path), [])
+
+        score = create_score("alice", "APPLE", 3, True)
+        scores_path.write_text(json.dumps([score]))
+        os.utime(scores_path, ns=(mtime_ns, mtime_ns))
+
+        self.assertEqual(load_scores(scores_path), [score])
+
+
+class TestSaveScore(ScratchDirTestCase):
     """Test cases for save_score function."""
 
     def test_save_score_new_file(self):
@@ -113,17 +157,16 @@ class TestSaveScore(unittest.TestCase):
             "date": "2024-01-01T14:00:00Z"
         }
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            scores_path = pathlib.Path(tmp_dir) / "test_scores.json"
+        scores_path = self._tmp_path()
 
-            # Save score
-            save_score(scores_path, test_score)
+        # Save score
+        save_score(scores_path, test_score)
 
-            # Verify file was created and contains our score
-            self.assertTrue(scores_path.exists())
-            scores = load_scores(scores_path)
-            self.assertEqual(len(scores), 1)
-            self.assertEqual(scores[0], test_score)
+        # Verify file was created and contains our score
+        self.assertTrue(scores_path.exists())
+        scores = load_scores(scores_path)
+        self.assertEqual(len(scores), 1)
+        self.assertEqual(scores[0], test_score)
 
     def test_save_score_append_to_existing(self):
         """Test that save_score appends to existing file."""
@@ -143,21 +186,145 @@ class TestSaveScore(unittest.TestCase):
             "date": "2024-01-01T15:00:00Z"
         }
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp_file:
-            json.dump([existing_score], tmp_file)
-            tmp_file_path = tmp_file.name
+        tmp_file_path = self._tmp_path()
+        tmp_file_path.write_text(json.dumps([existing_score]))
+
+        # Save new score
+        save_score(tmp_file_path, new_score)
+
+        # Verify both scores are there
+        scores = load_scores(tmp_file_path)
+        self.assertEqual(len(scores), 2)
+        self.assertEqual(scores[0], existing_score)
+        self.assertEqual(scores[1], new_score)
+
+    def test_save_score_json_appends_in_place(self):
+        """Test that appending to a .json file keeps the pretty-printed layout."""
+        scores = [
+            create_score("alice", "APPLE", 3, True),
+            create_score("zoë", "GRAPE", 6, False),
+            create_score("bob", "PEACH", 2, True)
+        ]
+
+        scores_path = self._tmp_path()
+
+        for score in scores:
+            save_score(scores_path, score)
 
-        try:
-            # Save new score
-            save_score(tmp_file_path, new_score)
+        content = scores_path.read_text(encoding='utf-8')
+        self.assertEqual(content, json.dumps(scores, indent=2, ensure_ascii=False))
+        self.assertEqual(load_scores(scores_path), scores)
 
-            # Verify both scores are there
-            scores = load_scores(tmp_file_path)
-            self.assertEqual(len(scores), 2)
-            self.assertEqual(scores[0], existing_score)
-            self.assertEqual(scores[1], new_score)
-        finally:
-            os.unlink(tmp_file_path)
+        # The lock is released again once the score is saved
+        with _score_file_lock(scores_path, timeout=0):
+            pass
+
+    def test_save_score_refuses_corrupt_json(self):
+        """Test that save_score doesn't append to a corrupt file that ends like a score list."""
+        scores_path = self._tmp_path()
+        scores_path.write_text('garbage {"x": 1}\n]', encoding='utf-8')
+
+        with self.assertRaises(RuntimeError) as context:
+            save_score(scores_path, create_score("alice", "APPLE", 3, True))
+        self.assertIn("Error loading scores", str(context.exception))
+        self.assertEqual(scores_path.read_text(encoding='utf-8'), 'garbage {"x": 1}\n]')
+
+    def test_save_score_ignores_leftover_lock_file(self):
+        """Test that a lock file left by a crashed process doesn't block saving."""
+        scores_path = self._tmp_path()
+        lock_path = scores_path.with_name(scores_path.name + ".lock")
+        lock_path.touch()
+
+        started = time.monotonic()
+        save_score(scores_path, create_score("alice", "APPLE", 3, True))
+
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(len(load_scores(scores_path)), 1)
+
+    def test_score_file_lock_is_exclusive(self):
+        """Test that a held lock makes other writers time out."""
+        scores_path = self._tmp_path()
+
+        with _score_file_lock(scores_path):
+            with self.assertRaises(TimeoutError):
+                with _score_file_lock(scores_path, timeout=0.05):
+                    pass
+
+    def test_save_score_jsonl_appends_lines(self):
+        """Test that save_score appends one line per score to .jsonl files."""
+        first_score = create_score("alice", "APPLE", 3, True)
+        second_score = create_score("bob", "GRAPE", 6, False)
+
+        scores_path = self._tmp_path(".jsonl")
+
+        save_score(scores_path, first_score)
+        self.assertEqual(load_scores(scores_path), [first_score])
+
+        save_score(scores_path, second_score)
+        self.assertEqual(load_scores(scores_path), [first_score, second_score])
+
+        lines = scores_path.read_text(encoding='utf-8').splitlines()
+        self.assertEqual([json.loads(line) for line in lines], [first_score, second_score])
+
+    def test_save_score_caches_a_copy(self):
+        """Test that changing a saved score dict doesn't change loaded scores."""
+        # Distinct stems, so the .jsonl file isn't migrated from the .json one
+        for suffix in (".json", "_lines.jsonl"):
+            with self.subTest(suffix=suffix):
+                first_score = create_score("alice", "APPLE", 3, True)
+                second_score = create_score("bob", "GRAPE", 6, False)
+                expected = [dict(first_score), dict(second_score)]
+
+                scores_path = self._tmp_path(suffix)
+
+                save_score(scores_path, first_score)
+                load_scores(scores_path)
+                save_score(scores_path, second_score)
+
+                first_score["attempts"] = 99
+                second_score["attempts"] = 99
+                self.assertEqual(load_scores(scores_path), expected)
+
+    def test_save_score_updates_last_played_index(self):
+        """Test that save_score keeps the per-player index in sync."""
+        older = {"player": "alice", "word": "APPLE", "attempts": 3, "won": True,
+                 "date": "2024-01-02T12:00:00Z"}
+        newer = {"player": "alice", "word": "GRAPE", "attempts": 4, "won": True,
+                 "date": "2024-01-03T12:00:00Z"}
+        other = {"player": "bob", "word": "PEACH", "attempts": 6, "won": False,
+                 "date": "2024-01-01T12:00:00Z"}
+
+        scores_path = self._tmp_path()
+
+        self.assertIsNone(load_last_played(scores_path))
+
+        for score in (newer, older, other):
+            save_score(scores_path, score)
+
+        self.assertEqual(load_last_played(scores_path), {
+            "alice": "2024-01-03T12:00:00Z",
+            "bob": "2024-01-01T12:00:00Z"
+        })
+
+        # Editing the scores file behind our back invalidates the index
+        scores_path.write_text(json.dumps([other]), encoding='utf-8')
+        self.assertIsNone(load_last_played(scores_path))
+
+    def test_save_score_index_per_scores_file(self):
+        """Test that .json and .jsonl files with the same stem keep separate indexes."""
+        json_path = self._tmp_path()
+        jsonl_path = self._tmp_path(".jsonl")
+
+        save_score(json_path, {"player": "alice", "word": "APPLE", "attempts": 3,
+                               "won": True, "date": "2024-01-02T12:00:00Z"})
+        save_score(jsonl_path, {"player": "bob", "word": "GRAPE", "attempts": 4,
+                                "won": True, "date": "2024-01-03T12:00:00Z"})
+
+        self.assertEqual(load_last_played(json_path), {"alice": "2024-01-02T12:00:00Z"})
+        self.assertEqual(load_last_played(jsonl_path), {
+            "alice": "2024-01-02T12:00:00Z",  # migrated from the .json file
+            "bob": "2024-01-03T12:00:00Z"
+        })
 
     def test_save_score_validation_missing_fields(self):
         """Test that save_score validates required fields."""
@@ -167,12 +334,11 @@ class TestSaveScore(unittest.TestCase):
             # Missing: attempts, won, date
         }
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            scores_path = pathlib.Path(tmp_dir) / "test.json"
+        scores_path = self._tmp_path()
 
-            with self.assertRaises(ValueError) as context:
-                save_score(scores_path, incomplete_score)
-            self.assertIn("missing required fields", str(context.exception))
+        with self.assertRaises(ValueError) as context:
+            save_score(scores_path, incomplete_score)
+        self.assertIn("missing required fields", str(context.exception))
 
     def test_save_score_validation_wrong_types(self):
         """Test that save_score validates field types."""
@@ -200,12 +366,11 @@ class TestSaveScore(unittest.TestCase):
             }
         ]
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            scores_path = pathlib.Path(tmp_dir) / "test.json"
+        scores_path = self._tmp_path()
 
-            for invalid_score in invalid_scores:
-                with self.assertRaises(ValueError):
-                    save_score(scores_path, invalid_score)
+        for invalid_score in invalid_scores:
+            with self.assertRaises(ValueError):
+                save_score(scores_path, invalid_score)
 
     def test_save_score_negative_attempts(self):
         """Test that save_score rejects negative attempts."""
@@ -217,12 +382,22 @@ class TestSaveScore(unittest.TestCase):
             "date": "2024-01-01T12:00:00Z"
         }
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            scores_path = pathlib.Path(tmp_dir) / "test.json"
+        scores_path = self._tmp_path()
 
-            with self.assertRaises(ValueError) as context:
-                save_score(scores_path, invalid_score)
-            self.assertIn("non-negative integer", str(context.exception))
+        with self.assertRaises(ValueError) as context:
+            save_score(scores_path, invalid_score)
+        self.assertIn("non-negative integer", str(context.exception))
+
+    def test_save_score_accepts_score_instance(self):
+        """Test that a Score is saved in the same layout as a dictionary."""
+        score = Score("testuser", "TIGER", 4, True, "2024-01-01T14:00:00Z")
+        scores_path = self._tmp_path()
+
+        save_score(scores_path, score)
+
+        self.assertEqual(load_scores(scores_path), [score.to_dict()])
+        with self.assertRaises(ValueError):
+            Score("testuser", "TIGER", -1, True, "2024-01-01T14:00:00Z")
 
 
 class TestGetTopScores(unittest.TestCase):
@@ -357,7 +532,3 @@ class TestCreateScore(unittest.TestCase):
         # Should be between before and after
         self.assertGreaterEqual(score_time, before)
         self.assertLessEqual(score_time, after)
-
-
-if __name__ == "__main__":
-    unittest.main(verbosity=2)
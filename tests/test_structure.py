@@ -5,27 +5,30 @@ Tests that verify the project structure, file existence,
 and basic content validation.
 """
 
-import os
-import sys
+import ast
+import importlib
 import unittest
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 
 class TestProjectStructure(unittest.TestCase):
     """Test cases for project structure validation."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.project_root = Path(__file__).parent.parent
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures and import the game class once for the class."""
+        cls.project_root = Path(__file__).parent.parent
+
+        # Importing game also imports daily and persistence
+        from game import WordGuruGame
+        cls.WordGuruGame = WordGuruGame
 
     def test_required_files_exist(self):
         """Test that all required files are present."""
         required_files = [
             '__init__.py',
             '__main__.py',
+            'cli.py',
             'game.py',
             'io_utils.py',
             'persistence.py',
@@ -45,6 +48,7 @@ class TestProjectStructure(unittest.TestCase):
         python_files = [
             '__init__.py',
             '__main__.py',
+            'cli.py',
             'game.py',
             'io_utils.py',
             'persistence.py',
@@ -56,11 +60,9 @@ class TestProjectStructure(unittest.TestCase):
         for filename in python_files:
             file_path = self.project_root / filename
             if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
+                # Parsing is enough to catch syntax errors; no bytecode needed
                 try:
-                    compile(content, filename, 'exec')
+                    ast.parse(file_path.read_bytes(), filename=filename)
                 except SyntaxError as e:
                     self.fail(f"Syntax error in {filename}: {e}")
 
@@ -73,20 +75,18 @@ class TestProjectStructure(unittest.TestCase):
             'daily'
         ]
 
+        # Modules setUpClass already imported (game, daily, persistence) are
+        # just sys.modules lookups here; io_utils is really imported
         for module_name in modules_to_test:
             try:
-                __import__(module_name)
+                importlib.import_module(module_name)
             except ImportError as e:
                 self.fail(f"Failed to import {module_name}: {e}")
 
     def test_main_classes_exist(self):
         """Test that main classes and functions are defined."""
         # Test WordGuruGame class exists
-        try:
-            from game import WordGuruGame
-            self.assertTrue(callable(WordGuruGame))
-        except ImportError as e:
-            self.fail(f"Failed to import WordGuruGame: {e}")
+        self.assertTrue(callable(self.WordGuruGame))
 
         # Test main utility functions exist
         try:
@@ -142,7 +142,3 @@ class TestGameClass(unittest.TestCase):
 
         except Exception as e:
             self.fail(f"Failed to instantiate WordGuruGame: {e}")
-
-
-if __name__ == "__main__":
-    unittest.main(verbosity=2)
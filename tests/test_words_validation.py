@@ -5,24 +5,37 @@ Tests validate the format and structure of word files without depending
 on specific content, ensuring tests work with any valid custom word list.
 """
 
+import re
+import string
 import unittest
-import os
-import sys
+from collections import Counter
 from pathlib import Path
 
-# Add the parent directory to the path so we can import our modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
 from io_utils import load_words
 
+# Bytes allowed in the newline-joined words; deleting them with
+# bytes.translate leaves nothing when every word is ASCII capitals
+_ASCII_CAPS_BYTES = string.ascii_uppercase.encode('ascii') + b"\n"
+
+# Words file lines that are not blank, a comment or exactly five
+# uppercase letters (optionally followed by a CR line ending)
+_SUSPECT_LINE = re.compile(rb"(?m)^(?![^\S\n]*(?:#|$)|[A-Z]{5}\r?$).*$")
+
 
 class TestWordFileFormat(unittest.TestCase):
     """Test word file format validation - works with any valid content."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.project_root = Path(__file__).parent.parent
-        self.words_file = self.project_root / 'words.txt'
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures, loading the word list once for the class."""
+        cls.project_root = Path(__file__).parent.parent
+        cls.words_file = cls.project_root / 'words.txt'
+        cls.words = load_words(cls.words_file)
+
+        # Classify every byte in one C-level pass, shared by the uppercase
+        # and alphabetic checks; non-empty ASCII capital words pass both
+        words_blob = "\n".join(cls.words).encode('utf-8')
+        cls.all_ascii_caps = all(cls.words) and not words_blob.translate(None, _ASCII_CAPS_BYTES)
 
     def test_words_file_exists(self):
         """Test that words.txt file exists."""
@@ -31,22 +44,19 @@ class TestWordFileFormat(unittest.TestCase):
 
     def test_words_file_loadable(self):
         """Test that words.txt file can be loaded without errors."""
-        try:
-            words = load_words(self.words_file)
-            self.assertIsInstance(words, list, "load_words should return a list")
-            self.assertGreater(len(words), 0, "words.txt should contain at least some words")
-        except Exception as e:
-            self.fail(f"words.txt file could not be loaded: {e}")
+        # Loading errors surface from setUpClass
+        self.assertIsInstance(self.words, list, "load_words should return a list")
+        self.assertGreater(len(self.words), 0, "words.txt should contain at least some words")
 
     def test_all_words_exactly_5_letters(self):
         """Test that all words have exactly 5 letters."""
-        words = load_words(self.words_file)
+        words = self.words
 
-        invalid_words = []
-        for word in words:
-            if len(word) != 5:
-                invalid_words.append(f"'{word}' (length: {len(word)})")
+        # Fast path: one C-level pass over the lengths
+        if set(map(len, words)) <= {5}:
+            return
 
+        invalid_words = [f"'{word}' (length: {len(word)})" for word in words if len(word) != 5]
         if invalid_words:
             error_msg = f"Found {len(invalid_words)} words that don't have exactly 5 letters:\n"
             error_msg += "\n".join(f"  {word}" for word in invalid_words[:10])  # Show first 10
@@ -56,13 +66,13 @@ class TestWordFileFormat(unittest.TestCase):
 
     def test_all_words_uppercase(self):
         """Test that all words are in uppercase."""
-        words = load_words(self.words_file)
+        words = self.words
 
-        invalid_words = []
-        for word in words:
-            if not word.isupper():
-                invalid_words.append(f"'{word}'")
+        # Fast path: checked once for the class, details only on failure
+        if self.all_ascii_caps:
+            return
 
+        invalid_words = [f"'{word}'" for word in words if not word.isupper()]
         if invalid_words:
             error_msg = f"Found {len(invalid_words)} words that are not in uppercase:\n"
             error_msg += "\n".join(f"  {word}" for word in invalid_words[:10])  # Show first 10
@@ -72,13 +82,13 @@ class TestWordFileFormat(unittest.TestCase):
 
     def test_all_words_alphabetic(self):
         """Test that all words contain only alphabetic characters."""
-        words = load_words(self.words_file)
+        words = self.words
 
-        invalid_words = []
-        for word in words:
-            if not word.isalpha():
-                invalid_words.append(f"'{word}'")
+        # Fast path: checked once for the class, details only on failure
+        if self.all_ascii_caps:
+            return
 
+        invalid_words = [f"'{word}'" for word in words if not word.isalpha()]
         if invalid_words:
             error_msg = f"Found {len(invalid_words)} words with non-alphabetic characters:\n"
             error_msg += "\n".join(f"  {word}" for word in invalid_words[:10])  # Show first 10
@@ -88,19 +98,14 @@ class TestWordFileFormat(unittest.TestCase):
 
     def test_no_duplicate_words(self):
         """Test that there are no duplicate words."""
-        words = load_words(self.words_file)
+        words = self.words
 
-        duplicates = []
-        seen = set()
+        # Fast path: building the set is a single C-level pass
+        if len(set(words)) == len(words):
+            return
 
-        for word in words:
-            if word in seen:
-                duplicates.append(word)
-            else:
-                seen.add(word)
-
-        if duplicates:
-            unique_duplicates = list(set(duplicates))
+        unique_duplicates = [word for word, count in Counter(words).items() if count > 1]
+        if unique_duplicates:
             error_msg = f"Found {len(unique_duplicates)} duplicate words: {', '.join(unique_duplicates[:10])}"
             if len(unique_duplicates) > 10:
                 error_msg += f" ... and {len(unique_duplicates) - 10} more"
@@ -108,27 +113,27 @@ class TestWordFileFormat(unittest.TestCase):
 
     def test_minimum_word_count(self):
         """Test that we have a reasonable number of words for gameplay."""
-        words = load_words(self.words_file)
+        words = self.words
         self.assertGreaterEqual(len(words), 10,
                                "Should have at least 10 words for meaningful gameplay")
 
     def test_words_file_format_consistency(self):
         """Test that the raw file format is consistent."""
-        with open(self.words_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
+        blob = self.words_file.read_bytes()
         issues = []
 
-        for line_num, line in enumerate(lines, 1):
-            original_line = line
-            line = line.strip()
-
-            # Skip comments and empty lines
-            if not line or line.startswith('#'):
-                continue
+        # Only lines that are not blank, a comment or a well-formed word are
+        # matched, so valid lines never become Python objects
+        line_num, pos = 1, 0
+        for match in _SUSPECT_LINE.finditer(blob):
+            line_num += blob.count(b'\n', pos, match.start())
+            pos = match.start()
+            raw_line = match.group().rstrip(b'\r')
+            stripped = raw_line.strip()
 
             # Check for common formatting issues
-            if original_line != line + '\n' and original_line != line:
+            line = stripped.decode('utf-8')
+            if raw_line != stripped:
                 issues.append(f"Line {line_num}: Extra whitespace around '{line}'")
 
             if line != line.upper():
@@ -151,10 +156,12 @@ class TestWordFileFormat(unittest.TestCase):
 class TestControlledWordList(unittest.TestCase):
     """Test validation logic using a controlled test word list."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.test_dir = Path(__file__).parent
-        self.test_words_file = self.test_dir / 'test_words.txt'
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures, loading the test word list once for the class."""
+        cls.test_dir = Path(__file__).parent
+        cls.test_words_file = cls.test_dir / 'test_words.txt'
+        cls.words = load_words(cls.test_words_file)
 
     def test_test_words_file_exists(self):
         """Test that test_words.txt file exists for validation testing."""
@@ -163,7 +170,7 @@ class TestControlledWordList(unittest.TestCase):
 
     def test_validation_logic_with_known_good_data(self):
         """Test that validation logic works correctly with known good data."""
-        words = load_words(self.test_words_file)
+        words = self.words
 
         # All words should pass validation
         self.assertGreater(len(words), 0, "Test file should have words")
@@ -175,7 +182,3 @@ class TestControlledWordList(unittest.TestCase):
 
         # No duplicates in test file
         self.assertEqual(len(words), len(set(words)), "Test file should have no duplicates")
-
-
-if __name__ == '__main__':
-    unittest.main(verbosity=2)